@@ -6,23 +6,21 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
 
-from .const import DOMAIN
+from .const import DOMAIN, PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
-    Platform.ALARM_CONTROL_PANEL,
-]
-
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Synthetic Alarm from a config entry."""
     _LOGGER.debug("Setting up Synthetic Alarm entry: %s", entry.entry_id)
     
     # Store configuration data
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = entry.data
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    domain_data[entry.entry_id] = entry.data
     
     # Forward the setup to the alarm control panel platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -39,6 +37,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Remove stored data
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id)
     
     return unload_ok
\ No newline at end of file
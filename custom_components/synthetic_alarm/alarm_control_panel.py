@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+from functools import partial
 import logging
 from typing import Any
 
@@ -14,10 +17,22 @@ from homeassistant.components.alarm_control_panel.const import (
     AlarmControlPanelState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    ServiceCall,
+    State,
+    callback,
+    split_entity_id,
+)
+from homeassistant.exceptions import ServiceNotFound
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
-from homeassistant.const import SERVICE_TURN_ON, SERVICE_TURN_OFF
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 
 from .const import (
     DOMAIN, 
@@ -28,10 +43,22 @@ from .const import (
     CONF_SCRIPT_DISARM_AWAY,
     CONF_ARMED_INDICATOR,
     CONF_ALARM_INDICATOR,
+    INTENT_DEBOUNCE_TIME,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+ScriptRunner = Callable[[], Coroutine[Any, Any, Any]]
+
+# Bind the states once, they are read on every transition
+_DISARMED = AlarmControlPanelState.DISARMED
+_ARMING = AlarmControlPanelState.ARMING
+_ARMED_HOME = AlarmControlPanelState.ARMED_HOME
+_ARMED_AWAY = AlarmControlPanelState.ARMED_AWAY
+_TRIGGERED = AlarmControlPanelState.TRIGGERED
+
+_ARMED_STATES = frozenset({_ARMED_HOME, _ARMED_AWAY})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,6 +80,7 @@ class SyntheticAlarmControlPanel(AlarmControlPanelEntity):
         AlarmControlPanelEntityFeature.ARM_HOME
         | AlarmControlPanelEntityFeature.ARM_AWAY
     )
+    # No code required
     _attr_code_format = None
     _attr_code_arm_required = False
 
@@ -60,7 +88,6 @@ class SyntheticAlarmControlPanel(AlarmControlPanelEntity):
         """Initialize the alarm control panel."""
         self._entry_id = entry_id
         self._config = config
-        self._hass = None  # Will be set in async_added_to_hass
         self._attr_name = config.get("name", "Synthetic Alarm")
         self._attr_unique_id = f"{DOMAIN}_{entry_id}"
         self._attr_device_info = {
@@ -70,7 +97,8 @@ class SyntheticAlarmControlPanel(AlarmControlPanelEntity):
             "model": "Synthetic Alarm Panel",
         }
         
-        self._state = AlarmControlPanelState.DISARMED
+        self._attr_alarm_state = _DISARMED
+        self._pending_arm_mode: AlarmControlPanelState | None = None
         self._delay_time = config.get("delay_time", 30)
         self._trigger_time = config.get("trigger_time", 600)
         
@@ -83,278 +111,381 @@ class SyntheticAlarmControlPanel(AlarmControlPanelEntity):
         # Indicator device entity IDs
         self._armed_indicator = config.get(CONF_ARMED_INDICATOR)
         self._alarm_indicator = config.get(CONF_ALARM_INDICATOR)
+        
+        # Entity IDs never change, so split them once instead of per call
+        self._svc_names = {
+            entity_id: split_entity_id(entity_id)[1]
+            for entity_id in (
+                self._script_arm_home,
+                self._script_disarm_home,
+                self._script_arm_away,
+                self._script_disarm_away,
+            )
+            if entity_id
+        }
+        
+        # Script service calls, bound once hass is available
+        self._run_arm_home: ScriptRunner | None = None
+        self._run_disarm_home: ScriptRunner | None = None
+        self._run_arm_away: ScriptRunner | None = None
+        self._run_disarm_away: ScriptRunner | None = None
+        
+        # Configuration is fixed for the entity lifetime, build attributes once
+        self._attr_extra_state_attributes = {
+            "configured_scripts": {
+                "arm_home": self._script_arm_home,
+                "disarm_home": self._script_disarm_home,
+                "arm_away": self._script_arm_away,
+                "disarm_away": self._script_disarm_away,
+            },
+            "configured_indicators": {
+                "armed": self._armed_indicator,
+                "alarm": self._alarm_indicator,
+            },
+        }
+        
+        # Background work spawned by service calls
+        self._pending_tasks: set[asyncio.Task] = set()
+        
+        # Arm requests are debounced so only the latest one is applied
+        self._pending_intent: AlarmControlPanelState | None = None
+        self._intent_unsub: CALLBACK_TYPE | None = None
+        
+        # Cancel handles for the arming delay and the trigger auto-reset
+        self._delay_unsub: CALLBACK_TYPE | None = None
+        self._reset_unsub: CALLBACK_TYPE | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        self._hass = self.hass
         
-        # Log configuration for debugging
-        _LOGGER.info("Synthetic Alarm Panel '%s' added to HA", self._attr_name)
-        _LOGGER.info("Configured scripts :")
-        _LOGGER.info("  - Arm Home: %s", self._script_arm_home)
-        _LOGGER.info("  - Disarm Home: %s", self._script_disarm_home)
-        _LOGGER.info("  - Arm Away: %s", self._script_arm_away)
-        _LOGGER.info("  - Disarm Away: %s", self._script_disarm_away)
-        _LOGGER.info("Configured input sensors (feedback from external system):")
-        _LOGGER.info("  - Armed Sensor: %s", self._armed_indicator)
-        _LOGGER.info("  - Alarm Sensor: %s", self._alarm_indicator)
-        _LOGGER.info("Timing settings:")
-        _LOGGER.info("  - Delay Time: %s seconds", self._delay_time)
-        _LOGGER.info("  - Trigger Time: %s seconds", self._trigger_time)
-        _LOGGER.info("Code requirement: DISABLED (no code needed)")
+        # Bind the script service calls once, their targets never change
+        self._run_arm_home = self._bind_script(self._script_arm_home)
+        self._run_disarm_home = self._bind_script(self._script_disarm_home)
+        self._run_arm_away = self._bind_script(self._script_arm_away)
+        self._run_disarm_away = self._bind_script(self._script_disarm_away)
         
-        # Verify script entities exist
-        if self._script_arm_home and not self.hass.states.get(self._script_arm_home):
-            _LOGGER.warning("Arm Home script entity %s does not exist!", self._script_arm_home)
-        if self._script_disarm_home and not self.hass.states.get(self._script_disarm_home):
-            _LOGGER.warning("Disarm Home script entity %s does not exist!", self._script_disarm_home)
-        if self._script_arm_away and not self.hass.states.get(self._script_arm_away):
-            _LOGGER.warning("Arm Away script entity %s does not exist!", self._script_arm_away)
-        if self._script_disarm_away and not self.hass.states.get(self._script_disarm_away):
-            _LOGGER.warning("Disarm Away script entity %s does not exist!", self._script_disarm_away)
+        scripts = self._attr_extra_state_attributes["configured_scripts"]
         
-        # Set up state change listeners for binary sensors
-        if self._armed_indicator:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass, [self._armed_indicator], self._sensor_state_changed
-                )
+        # Log configuration for debugging, skip building it when not needed
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Synthetic Alarm Panel '%s' added to HA: %s",
+                self._attr_name,
+                {
+                    "scripts": scripts,
+                    "input_sensors": self._attr_extra_state_attributes[
+                        "configured_indicators"
+                    ],
+                    "delay_time": self._delay_time,
+                    "trigger_time": self._trigger_time,
+                },
             )
-        if self._alarm_indicator:
+        
+        # Verify script entities exist
+        missing = [
+            f"{action}: {entity_id}"
+            for action, entity_id in scripts.items()
+            if entity_id and not self.hass.states.get(entity_id)
+        ]
+        if missing:
+            _LOGGER.warning("Script entities do not exist: %s", ", ".join(missing))
+        
+        # Set up a single state change listener for both binary sensors
+        entities = [
+            entity_id
+            for entity_id in (self._armed_indicator, self._alarm_indicator)
+            if entity_id
+        ]
+        if entities:
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._alarm_indicator], self._sensor_state_changed
+                    self.hass, entities, self._sensor_state_changed
                 )
             )
         
         # Initial sensor state check
-        await self._monitor_sensors()
+        self._monitor_sensors()
 
-    async def _sensor_state_changed(self, event) -> None:
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._cancel_intent()
+        self._cancel_arming_delay()
+        self._cancel_auto_reset()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _sensor_state_changed(self, event: Event[EventStateChangedData]) -> None:
         """Handle sensor state changes."""
-        _LOGGER.info("Sensor state changed: %s", event.data)
-        await self._monitor_sensors()
-
-    @property
-    def state(self) -> AlarmControlPanelState:
-        """Return the state of the alarm control panel."""
-        return self._state
-
-    @property
-    def code_format(self) -> str | None:
-        """Return the code format if a code is required."""
-        return None  # No code required
-    
-    @property
-    def code_arm_required(self) -> bool:
-        """Return if the code is required for arming."""
-        return False
-    
-    @property 
-    def code_disarm_required(self) -> bool:
-        """Return if the code is required for disarming."""
-        return False
+        new_state = event.data["new_state"]
+        old_state = event.data["old_state"]
+        if new_state is None or (
+            old_state is not None and old_state.state == new_state.state
+        ):
+            # Sensor removed or only its attributes changed
+            return
+        _LOGGER.debug("Sensor state changed: %s", event.data)
+        
+        # The event carries the new state, no need to look it up again
+        entity_id = event.data["entity_id"]
+        if entity_id == self._armed_indicator:
+            self._apply_armed_state(new_state)
+        if entity_id == self._alarm_indicator:
+            self._apply_alarm_state(new_state)
+
+    def _bind_script(self, script_entity_id: str | None) -> ScriptRunner | None:
+        """Bind the service call that runs a script."""
+        script_name = self._svc_names.get(script_entity_id)
+        if not script_name:
+            return None
+        # Use blocking=False for immediate execution
+        return partial(
+            self.hass.services.async_call, "script", script_name, blocking=False
+        )
 
-    async def _call_script(self, script_entity_id: str | None) -> None:
+    async def _call_script(
+        self, script_entity_id: str | None, run_script: ScriptRunner | None
+    ) -> None:
         """Call a script if configured."""
-        _LOGGER.info("_call_script called with entity_id: %s", script_entity_id)
+        _LOGGER.debug("_call_script called with entity_id: %s", script_entity_id)
         
-        if not script_entity_id:
-            _LOGGER.info("No script configured, skipping script execution")
-            return
-            
-        if not self._hass:
-            _LOGGER.error("HomeAssistant instance not available for script execution")
+        if not script_entity_id or not run_script:
+            _LOGGER.debug("No script configured, skipping script execution")
             return
             
         try:
-            _LOGGER.info("About to call script: %s", script_entity_id)
-            script_name = script_entity_id.split(".", 1)[1]
-            _LOGGER.info("Extracted script name: %s", script_name)
-            
-            # Check if script exists
-            if not self._hass.states.get(script_entity_id):
-                _LOGGER.error("Script entity %s does not exist!", script_entity_id)
-                return
-            
-            _LOGGER.info("Script entity exists, calling service immediately...")
-            # Use blocking=False for immediate execution
-            await self._hass.services.async_call(
-                "script",
-                script_name,
-                blocking=False
-            )
-            _LOGGER.info("Successfully called script (non-blocking): %s", script_entity_id)
+            _LOGGER.debug("About to call script: %s", script_entity_id)
+            await run_script()
+            _LOGGER.debug("Successfully called script (non-blocking): %s", script_entity_id)
+        except ServiceNotFound:
+            # Already warned about at startup, keep the log to one line
+            _LOGGER.error("Script entity %s does not exist!", script_entity_id)
         except Exception as err:
             _LOGGER.error("Failed to call script %s: %s", script_entity_id, err)
             _LOGGER.exception("Full exception details:")
 
-    async def _monitor_sensors(self) -> None:
-        """Monitor binary sensors and update alarm state accordingly."""
-        if not self._hass:
-            return
-            
-        # Check armed sensor
+    @callback
+    def _monitor_sensors(self) -> None:
+        """Read both binary sensors and update alarm state accordingly."""
         if self._armed_indicator:
-            armed_state = self._hass.states.get(self._armed_indicator)
-            if armed_state:
-                is_armed = armed_state.state == "on"
-                _LOGGER.info("Armed sensor %s state: %s (armed: %s)", self._armed_indicator, armed_state.state, is_armed)
-                
-                # Update alarm state based on sensor
-                if is_armed and self._state == AlarmControlPanelState.ARMING:
-                    # Transition from arming to armed (determine home vs away based on last command)
-                    if hasattr(self, '_pending_arm_mode'):
-                        self._state = self._pending_arm_mode
-                        delattr(self, '_pending_arm_mode')
-                    else:
-                        self._state = AlarmControlPanelState.ARMED_AWAY  # Default
-                    self.async_write_ha_state()
-                    _LOGGER.info("Transitioned to %s based on armed sensor", self._state)
-                elif not is_armed and self._state in [AlarmControlPanelState.ARMED_HOME, AlarmControlPanelState.ARMED_AWAY]:
-                    # Armed sensor went off, system is disarmed
-                    self._state = AlarmControlPanelState.DISARMED
-                    self.async_write_ha_state()
-                    _LOGGER.info("Transitioned to DISARMED based on armed sensor")
-        
-        # Check alarm sensor
+            self._apply_armed_state(self.hass.states.get(self._armed_indicator))
         if self._alarm_indicator:
-            alarm_state = self._hass.states.get(self._alarm_indicator)
-            if alarm_state:
-                is_triggered = alarm_state.state == "on"
-                _LOGGER.info("Alarm sensor %s state: %s (triggered: %s)", self._alarm_indicator, alarm_state.state, is_triggered)
-                
-                if is_triggered and self._state != AlarmControlPanelState.TRIGGERED:
-                    # Alarm was triggered by external system
-                    self._state = AlarmControlPanelState.TRIGGERED
-                    self.async_write_ha_state()
-                    _LOGGER.info("Alarm TRIGGERED based on alarm sensor")
-                elif not is_triggered and self._state == AlarmControlPanelState.TRIGGERED:
-                    # Alarm sensor cleared, back to disarmed
-                    self._state = AlarmControlPanelState.DISARMED
-                    self.async_write_ha_state()
-                    _LOGGER.info("Alarm cleared, back to DISARMED based on alarm sensor")
+            self._apply_alarm_state(self.hass.states.get(self._alarm_indicator))
+
+    @callback
+    def _apply_armed_state(self, armed_state: State | None) -> None:
+        """Update alarm state from the armed sensor state."""
+        if armed_state:
+            is_armed = armed_state.state == "on"
+            _LOGGER.debug("Armed sensor %s state: %s (armed: %s)", self._armed_indicator, armed_state.state, is_armed)
+            
+            # Update alarm state based on sensor
+            if is_armed and self._attr_alarm_state == _ARMING:
+                # Transition from arming to armed (determine home vs away based on last command)
+                self._cancel_arming_delay()
+                mode = self._pending_arm_mode or _ARMED_AWAY  # Default
+                self._pending_arm_mode = None
+                self._async_set_state(mode)
+                _LOGGER.info("Transitioned to %s based on armed sensor", self._attr_alarm_state)
+            elif not is_armed and self._attr_alarm_state in _ARMED_STATES:
+                # Armed sensor went off, system is disarmed
+                self._async_set_state(_DISARMED)
+                _LOGGER.info("Transitioned to DISARMED based on armed sensor")
+
+    @callback
+    def _apply_alarm_state(self, alarm_state: State | None) -> None:
+        """Update alarm state from the alarm sensor state."""
+        if alarm_state:
+            is_triggered = alarm_state.state == "on"
+            _LOGGER.debug("Alarm sensor %s state: %s (triggered: %s)", self._alarm_indicator, alarm_state.state, is_triggered)
+            
+            if is_triggered and self._attr_alarm_state != _TRIGGERED:
+                # Alarm was triggered by external system
+                self._cancel_intent()
+                self._async_set_state(_TRIGGERED)
+                _LOGGER.info("Alarm TRIGGERED based on alarm sensor")
+            elif not is_triggered and self._attr_alarm_state == _TRIGGERED:
+                # Alarm sensor cleared, back to disarmed
+                self._cancel_auto_reset()
+                self._async_set_state(_DISARMED)
+                _LOGGER.info("Alarm cleared, back to DISARMED based on alarm sensor")
+
+    @callback
+    def _async_set_state(self, state: AlarmControlPanelState) -> None:
+        """Set the panel state, writing it only if it changed."""
+        if state == self._attr_alarm_state:
+            return
+        self._attr_alarm_state = state
+        self.async_write_ha_state()
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
-        _LOGGER.info("async_alarm_disarm called")
+        _LOGGER.debug("async_alarm_disarm called")
         
-        current_state = self._state
-        _LOGGER.info("Disarming from state: %s", current_state)
+        # Disarming is never delayed, it supersedes any pending arm request
+        # and a pending trigger auto-reset
+        self._cancel_intent()
+        self._cancel_auto_reset()
+        
+        current_state = self._attr_alarm_state
+        _LOGGER.debug("Disarming from state: %s", current_state)
+        
+        if current_state == _ARMING:
+            # Stop the exit delay countdown right away and undo the arm
+            # request that started it
+            self._cancel_arming_delay()
+            if self._pending_arm_mode is not None:
+                current_state = self._pending_arm_mode
+                self._pending_arm_mode = None
+            self._async_set_state(_DISARMED)
         
         # Call appropriate disarm script IMMEDIATELY based on current state
-        if current_state == AlarmControlPanelState.ARMED_HOME:
-            _LOGGER.info("Calling disarm home script immediately: %s", self._script_disarm_home)
-            await self._call_script(self._script_disarm_home)
-        elif current_state == AlarmControlPanelState.ARMED_AWAY:
-            _LOGGER.info("Calling disarm away script immediately: %s", self._script_disarm_away)
-            await self._call_script(self._script_disarm_away)
+        if current_state == _ARMED_HOME:
+            _LOGGER.debug("Calling disarm home script immediately: %s", self._script_disarm_home)
+            self._async_track_task(
+                self._call_script(self._script_disarm_home, self._run_disarm_home)
+            )
+        elif current_state == _ARMED_AWAY:
+            _LOGGER.debug("Calling disarm away script immediately: %s", self._script_disarm_away)
+            self._async_track_task(
+                self._call_script(self._script_disarm_away, self._run_disarm_away)
+            )
         else:
-            _LOGGER.info("No disarm script to call for previous state: %s", current_state)
+            _LOGGER.debug("No disarm script to call for previous state: %s", current_state)
         
         # Script will control external system, sensors will update our state
-        _LOGGER.info("Disarm script executed, waiting for sensor feedback to update state")
-        _LOGGER.info("Disarm sequence complete")
+        _LOGGER.debug("Disarm script dispatched, waiting for sensor feedback to update state")
+        _LOGGER.debug("Disarm sequence complete")
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
-        _LOGGER.info("async_alarm_arm_home called")
-        
-        _LOGGER.info("Starting arm home sequence, delay_time: %s", self._delay_time)
-        
-        # Set pending mode for sensor feedback
-        self._pending_arm_mode = AlarmControlPanelState.ARMED_HOME
-        
-        # Call arm home script IMMEDIATELY before any delays
-        _LOGGER.info("Calling arm home script immediately: %s", self._script_arm_home)
-        await self._call_script(self._script_arm_home)
-        
-        if self._delay_time > 0:
-            _LOGGER.info("Entering ARMING state for %s seconds", self._delay_time)
-            self._state = AlarmControlPanelState.ARMING
-            self.async_write_ha_state()
-            
-            # Wait for delay or sensor feedback
-            await asyncio.sleep(self._delay_time)
-            
-            # If still arming after delay, check sensors or default to armed
-            if self._state == AlarmControlPanelState.ARMING:
-                await self._monitor_sensors()
-                # If still arming and no sensor feedback, assume success
-                if self._state == AlarmControlPanelState.ARMING:
-                    _LOGGER.info("No sensor feedback, defaulting to ARMED_HOME")
-                    self._state = AlarmControlPanelState.ARMED_HOME
-                    self.async_write_ha_state()
-        else:
-            # No delay, monitor sensors immediately
-            await self._monitor_sensors()
-        
-        _LOGGER.info("Arm home sequence complete")
+        _LOGGER.debug("async_alarm_arm_home called")
+        self._async_set_intent(_ARMED_HOME)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
-        _LOGGER.info("async_alarm_arm_away called")
+        _LOGGER.debug("async_alarm_arm_away called")
+        self._async_set_intent(_ARMED_AWAY)
+
+    @callback
+    def _arm(
+        self,
+        mode: AlarmControlPanelState,
+        script_entity_id: str | None,
+        run_script: ScriptRunner | None,
+    ) -> None:
+        """Run the arm sequence for the given mode."""
+        _LOGGER.debug("Starting %s sequence, delay_time: %s", mode, self._delay_time)
         
-        _LOGGER.info("Starting arm away sequence, delay_time: %s", self._delay_time)
+        # A stale trigger auto-reset must not disarm the new arm request
+        self._cancel_auto_reset()
         
         # Set pending mode for sensor feedback
-        self._pending_arm_mode = AlarmControlPanelState.ARMED_AWAY
+        self._pending_arm_mode = mode
         
-        # Call arm away script IMMEDIATELY before any delays
-        _LOGGER.info("Calling arm away script immediately: %s", self._script_arm_away)
-        await self._call_script(self._script_arm_away)
+        # Dispatch arm script IMMEDIATELY without waiting for it, so the
+        # ARMING state is written in the same loop iteration
+        _LOGGER.debug("Calling arm script immediately: %s", script_entity_id)
+        self._async_track_task(self._call_script(script_entity_id, run_script))
         
         if self._delay_time > 0:
-            _LOGGER.info("Entering ARMING state for %s seconds", self._delay_time)
-            self._state = AlarmControlPanelState.ARMING
-            self.async_write_ha_state()
-            
-            # Wait for delay or sensor feedback
-            await asyncio.sleep(self._delay_time)
+            _LOGGER.debug("Entering ARMING state for %s seconds", self._delay_time)
+            self._async_set_state(_ARMING)
             
-            # If still arming after delay, check sensors or default to armed
-            if self._state == AlarmControlPanelState.ARMING:
-                await self._monitor_sensors()
-                # If still arming and no sensor feedback, assume success
-                if self._state == AlarmControlPanelState.ARMING:
-                    _LOGGER.info("No sensor feedback, defaulting to ARMED_AWAY")
-                    self._state = AlarmControlPanelState.ARMED_AWAY
-                    self.async_write_ha_state()
+            # Wait for delay or sensor feedback without holding a task
+            self._cancel_arming_delay()
+            self._delay_unsub = async_call_later(
+                self.hass, self._delay_time, self._arming_timeout
+            )
         else:
             # No delay, monitor sensors immediately
-            await self._monitor_sensors()
+            self._monitor_sensors()
         
-        _LOGGER.info("Arm away sequence complete")
+        _LOGGER.debug("%s sequence complete", mode)
+
+    @callback
+    def _async_set_intent(self, mode: AlarmControlPanelState) -> None:
+        """Record an arm request and apply it once requests settle."""
+        self._pending_intent = mode
+        if self._intent_unsub:
+            self._intent_unsub()
+        self._intent_unsub = async_call_later(
+            self.hass, INTENT_DEBOUNCE_TIME, self._apply_intent
+        )
+
+    @callback
+    def _apply_intent(self, _now: datetime) -> None:
+        """Run the sequence for the latest arm request."""
+        mode = self._pending_intent
+        self._pending_intent = None
+        self._intent_unsub = None
+        _LOGGER.debug("Applying arm request: %s", mode)
+        if mode == _ARMED_HOME:
+            self._arm(mode, self._script_arm_home, self._run_arm_home)
+        elif mode == _ARMED_AWAY:
+            self._arm(mode, self._script_arm_away, self._run_arm_away)
+
+    @callback
+    def _arming_timeout(self, _now: datetime) -> None:
+        """Finish arming once the delay has passed."""
+        self._delay_unsub = None
+        
+        # If still arming after delay, check sensors or default to armed
+        if self._attr_alarm_state == _ARMING:
+            self._monitor_sensors()
+            # If still arming and no sensor feedback, assume success
+            if self._attr_alarm_state == _ARMING:
+                mode = self._pending_arm_mode or _ARMED_AWAY
+                self._pending_arm_mode = None
+                _LOGGER.info("No sensor feedback, defaulting to %s", mode)
+                self._async_set_state(mode)
+
+    @callback
+    def _cancel_arming_delay(self) -> None:
+        """Cancel a pending arming delay."""
+        if self._delay_unsub:
+            self._delay_unsub()
+            self._delay_unsub = None
+
+    @callback
+    def _cancel_intent(self) -> None:
+        """Drop an arm request that has not been applied yet."""
+        if self._intent_unsub:
+            self._intent_unsub()
+            self._intent_unsub = None
+        self._pending_intent = None
 
     async def async_alarm_trigger(self, code: str | None = None) -> None:
         """Trigger the alarm."""
-        self._state = AlarmControlPanelState.TRIGGERED
-        self.async_write_ha_state()
-        
-        # Update indicators
-        await self._update_indicators()
+        self._cancel_intent()
+        self._async_set_state(_TRIGGERED)
         
-        # Auto-reset after trigger time
+        # Schedule the auto-reset in the background so the service call
+        # returns as soon as the state is written
         if self._trigger_time > 0:
-            await asyncio.sleep(self._trigger_time)
-            self._state = AlarmControlPanelState.DISARMED
-            self.async_write_ha_state()
-            await self._update_indicators()
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            "configured_scripts": {
-                "arm_home": self._script_arm_home,
-                "disarm_home": self._script_disarm_home,
-                "arm_away": self._script_arm_away,
-                "disarm_away": self._script_disarm_away,
-            },
-            "configured_indicators": {
-                "armed": self._armed_indicator,
-                "alarm": self._alarm_indicator,
-            },
-        }
-        return attrs
\ No newline at end of file
+            self._cancel_auto_reset()
+            self._reset_unsub = async_call_later(
+                self.hass, self._trigger_time, self._auto_reset
+            )
+
+    @callback
+    def _auto_reset(self, _now: datetime) -> None:
+        """Disarm the alarm once it has been triggered for trigger_time."""
+        self._reset_unsub = None
+        if self._attr_alarm_state != _TRIGGERED:
+            return
+        self._async_set_state(_DISARMED)
+
+    @callback
+    def _cancel_auto_reset(self) -> None:
+        """Cancel a pending trigger auto-reset."""
+        if self._reset_unsub:
+            self._reset_unsub()
+            self._reset_unsub = None
+
+    @callback
+    def _async_track_task(self, target: Coroutine[Any, Any, None]) -> None:
+        """Start a coroutine eagerly as a task and keep a reference until done."""
+        task = self.hass.async_create_task(target, eager_start=True)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
@@ -12,13 +12,30 @@ import homeassistant.helpers.config_validation as cv
 from .const import DOMAIN
 
 
-def _get_entity_list(hass: HomeAssistant, domain: str) -> list[str]:
-    """Get list of entities for a specific domain."""
-    entities = []
-    for entity_id in hass.states.async_entity_ids():
-        if entity_id.startswith(f"{domain}."):
-            entities.append(entity_id)
-    return sorted(entities)
+def _get_entity_options(
+    hass: HomeAssistant, domains: tuple[str, ...]
+) -> list[dict[str, str]]:
+    """Get select options for all entities of the given domains."""
+    return sorted(
+        (
+            {
+                "value": state.entity_id,
+                "label": state.attributes.get("friendly_name", state.entity_id),
+            }
+            for state in hass.states.async_all(domains)
+        ),
+        key=lambda option: option["value"],
+    )
+
+
+def _dropdown(options: list[dict[str, str]]) -> selector.SelectSelector:
+    """Build a dropdown selector for the given options."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    )
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -26,6 +43,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 2
 
+    # Selectors are built on first display and reused when a form is shown again
+    _script_selector: selector.SelectSelector | None = None
+    _indicator_selector: selector.SelectSelector | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -66,37 +87,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_devices()
 
         # Get available scripts
-        script_entities = _get_entity_list(self.hass, "script")
-        script_options = [{"value": entity, "label": self.hass.states.get(entity).attributes.get("friendly_name", entity)} for entity in script_entities]
+        if self._script_selector is None:
+            self._script_selector = _dropdown(
+                _get_entity_options(self.hass, ("script",))
+            )
+        script_selector = self._script_selector
 
         return self.async_show_form(
             step_id="scripts",
             data_schema=vol.Schema(
                 {
-                    vol.Optional("script_arm_home"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=script_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Optional("script_disarm_home"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=script_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Optional("script_arm_away"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=script_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Optional("script_disarm_away"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=script_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    vol.Optional("script_arm_home"): script_selector,
+                    vol.Optional("script_disarm_home"): script_selector,
+                    vol.Optional("script_arm_away"): script_selector,
+                    vol.Optional("script_disarm_away"): script_selector,
                 }
             ),
             errors=errors,
@@ -123,29 +127,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         # Get available switch/light entities for LED indicators
-        switch_entities = _get_entity_list(self.hass, "switch")
-        light_entities = _get_entity_list(self.hass, "light")
-        binary_sensor_entities = _get_entity_list(self.hass, "binary_sensor")
-        
-        indicator_entities = switch_entities + light_entities + binary_sensor_entities
-        indicator_options = [{"value": entity, "label": self.hass.states.get(entity).attributes.get("friendly_name", entity)} for entity in indicator_entities]
+        if self._indicator_selector is None:
+            self._indicator_selector = _dropdown(
+                _get_entity_options(self.hass, ("switch", "light", "binary_sensor"))
+            )
+        indicator_selector = self._indicator_selector
 
         return self.async_show_form(
             step_id="devices",
             data_schema=vol.Schema(
                 {
-                    vol.Optional("armed_indicator"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=indicator_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
-                    vol.Optional("alarm_indicator"): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=indicator_options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    vol.Optional("armed_indicator"): indicator_selector,
+                    vol.Optional("alarm_indicator"): indicator_selector,
                 }
             ),
             errors=errors,
@@ -7,7 +7,7 @@ DOMAIN = "synthetic_alarm"
 DEFAULT_NAME = "Synthetic Alarm"
 MANUFACTURER = "Synthetic"
 
-PLATFORMS = [Platform.ALARM_CONTROL_PANEL]
+PLATFORMS: tuple[Platform, ...] = (Platform.ALARM_CONTROL_PANEL,)
 
 # Configuration keys for scripts
 CONF_SCRIPT_ARM_HOME = "script_arm_home"
@@ -21,4 +21,7 @@ CONF_ALARM_INDICATOR = "alarm_indicator"
 
 # Default values
 DEFAULT_DELAY_TIME = 30
-DEFAULT_TRIGGER_TIME = 600
\ No newline at end of file
+DEFAULT_TRIGGER_TIME = 600
+
+# Seconds to wait for further arm requests before applying the latest one
+INTENT_DEBOUNCE_TIME = 0.25